@@ -0,0 +1,69 @@
+"""Subject cache for validated JWT bearer tokens."""
+
+import hashlib
+import threading
+import time
+from typing import Callable
+
+from cachetools import TLRUCache
+from celine.sdk.policies import Subject
+
+
+class SubjectCache:
+    """TTL cache of subjects resolved from validated tokens (thread-safe).
+
+    Keyed by the SHA-256 digest of the raw token. An entry lives for at most
+    ``ttl_seconds`` and never past the token's ``exp`` claim. Only successful
+    validations should be stored, so bad tokens are always re-checked.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10_000,
+        ttl_seconds: int = 60,
+        enabled: bool = True,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        self._cache: TLRUCache[bytes, tuple[Subject, float]] = TLRUCache(
+            maxsize=maxsize, ttu=self._ttu, timer=timer
+        )
+        self._ttl = ttl_seconds
+        self._enabled = enabled
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> Subject | None:
+        if not self._enabled:
+            return None
+        key = self._make_key(token)
+        with self._lock:
+            entry = self._cache.get(key)
+        return entry[0] if entry is not None else None
+
+    def set(self, token: str, subject: Subject, expires_at: float | None) -> None:
+        """Store a subject until ``expires_at`` (epoch seconds), capped by the TTL."""
+        if not self._enabled:
+            return
+        ttl = float(self._ttl)
+        if expires_at is not None:
+            ttl = min(ttl, expires_at - time.time())
+        if ttl <= 0:
+            return
+        key = self._make_key(token)
+        with self._lock:
+            self._cache[key] = (subject, ttl)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._cache)
+
+    @staticmethod
+    def _ttu(_key: bytes, value: tuple[Subject, float], now: float) -> float:
+        return now + value[1]
+
+    @staticmethod
+    def _make_key(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
@@ -33,6 +33,20 @@ class MqttAuthSettings(BaseSettings):
     policies_cache_maxsize: int = Field(
         default=10000, description="Maximum cache entries"
     )
+    policy_worker_threads: int = Field(
+        default=4, description="Threads dedicated to policy evaluation"
+    )
+
+    # Subject cache settings
+    subject_cache_enabled: bool = Field(
+        default=True, description="Cache subjects resolved from validated JWTs"
+    )
+    subject_cache_ttl: int = Field(
+        default=60, description="Subject cache TTL in seconds (capped by token exp)"
+    )
+    subject_cache_maxsize: int = Field(
+        default=10000, description="Maximum subject cache entries"
+    )
 
     # MQTT-specific settings
     mqtt_policy_package: str = Field(
@@ -44,3 +58,10 @@ class MqttAuthSettings(BaseSettings):
 
     # Service settings
     log_level: str = Field(default="INFO", description="Logging level")
+    log_queue_maxsize: int = Field(
+        default=10000,
+        description="Maximum log records buffered for the background writer",
+    )
+    log_batch_size: int = Field(
+        default=100, description="Maximum log records coalesced into one write"
+    )
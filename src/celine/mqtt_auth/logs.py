@@ -0,0 +1,196 @@
+"""Logging configuration for MQTT auth service.
+
+Request handlers only enqueue log records; formatting and stream writes happen
+on a background listener thread so log I/O never blocks the event loop.
+"""
+
+import logging
+import logging.handlers
+import queue
+import sys
+
+from celine.mqtt_auth.config import MqttAuthSettings
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that never blocks the caller.
+
+    When the queue is full the oldest queued record is evicted to make room
+    for the newest one. Evictions are counted in ``dropped`` and reported by
+    a single summary record as soon as the queue has room again.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._unreported = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The queue is in-process: hand the record over as-is and let the
+        # listener thread do the formatting.
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        # Called under the handler lock, so producers never race each other
+        if self._unreported:
+            try:
+                self.queue.put_nowait(self._drop_summary(self._unreported))
+                self._unreported = 0
+            except queue.Full:
+                pass
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+        try:
+            self.queue.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            self.dropped += 1
+            self._unreported += 1
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            self._unreported += 1
+
+    @staticmethod
+    def _drop_summary(count: int) -> logging.LogRecord:
+        return logging.LogRecord(
+            __name__,
+            logging.WARNING,
+            __file__,
+            0,
+            "Dropped %d log records: log queue full",
+            (count,),
+            None,
+        )
+
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """Stream handler that coalesces formatted records into batched writes.
+
+    Records are written once ``batch_size`` of them are buffered or when
+    ``flush()`` is called. A failed write drops its batch and is reported
+    through ``handleError``, like ``StreamHandler.emit`` does; it never
+    propagates to the caller.
+    """
+
+    def __init__(self, stream=None, batch_size: int = 100):
+        super().__init__(stream)
+        self.batch_size = batch_size
+        self._buffer: list[str] = []
+        self._last_record: logging.LogRecord | None = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._buffer.append(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+            return
+        self._last_record = record
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        with self.lock:
+            data = "".join(self._buffer)
+            self._buffer.clear()
+            try:
+                if data:
+                    self.stream.write(data)
+                super().flush()
+            except Exception:
+                if self._last_record is not None:
+                    self.handleError(self._last_record)
+
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """Queue listener that flushes its handlers whenever the queue runs dry.
+
+    Under load records accumulate in buffered handlers and are written in
+    batches; when idle every record is flushed as soon as it is handled.
+    """
+
+    def enqueue_sentinel(self) -> None:
+        # The queue is bounded: on overload evict the oldest records, as
+        # DroppingQueueHandler does, instead of failing to stop.
+        while True:
+            try:
+                self.queue.put_nowait(self._sentinel)
+                return
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            self.flush()
+        return self.queue.get(block)
+
+    def flush(self) -> None:
+        for handler in self.handlers:
+            try:
+                handler.flush()
+            except Exception:
+                # An exception here would end the listener thread and with
+                # it all logging, so a failed flush is only skipped.
+                pass
+
+
+def _is_console_handler(handler: logging.Handler) -> bool:
+    return type(handler) is logging.StreamHandler and handler.stream in (
+        sys.stderr,
+        sys.stdout,
+        sys.__stderr__,
+        sys.__stdout__,
+    )
+
+
+def configure_logging(settings: MqttAuthSettings) -> BatchingQueueListener | None:
+    """Route root logging through a bounded queue and a background writer.
+
+    Plain console handlers on the root logger (e.g. the one ``celine.sdk``
+    installs on import) are removed, since the background writer takes over
+    console output. Any other handler is left in place.
+
+    Returns:
+        The started listener, or ``None`` if logging is already queued.
+    """
+    root = logging.getLogger()
+    if any(isinstance(h, DroppingQueueHandler) for h in root.handlers):
+        return None
+
+    for handler in root.handlers[:]:
+        if _is_console_handler(handler):
+            root.removeHandler(handler)
+
+    writer = BufferedStreamHandler(batch_size=settings.log_batch_size)
+    writer.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    log_queue: queue.Queue = queue.Queue(maxsize=settings.log_queue_maxsize)
+    root.addHandler(DroppingQueueHandler(log_queue))
+    root.setLevel(getattr(logging, settings.log_level.upper()))
+
+    listener = BatchingQueueListener(log_queue, writer)
+    listener.start()
+    return listener
+
+
+def shutdown_logging(listener: BatchingQueueListener) -> None:
+    """Detach the queue from the root logger, then drain and flush it."""
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        if isinstance(handler, DroppingQueueHandler):
+            root.removeHandler(handler)
+
+    listener.stop()
+    listener.flush()
@@ -1,13 +1,18 @@
 """FastAPI application for MQTT authentication."""
 
+import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 
 from celine.sdk.policies import CachedPolicyEngine, DecisionCache, PolicyEngine
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
+from celine.mqtt_auth.cache import SubjectCache
 from celine.mqtt_auth.config import MqttAuthSettings
-from celine.mqtt_auth.routes import get_engine, get_settings, router
+from celine.mqtt_auth.logs import configure_logging, shutdown_logging
+from celine.mqtt_auth.routes import router
 
 logger = logging.getLogger(__name__)
 
@@ -20,12 +25,6 @@ def create_app() -> FastAPI:
     """
     settings = MqttAuthSettings()
 
-    # Configure logging
-    logging.basicConfig(
-        level=getattr(logging, settings.log_level.upper()),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    )
-
     # Initialize policy engine
     logger.info("Loading policies from %s", settings.policies_dir)
     engine = PolicyEngine(
@@ -57,6 +56,20 @@ def create_app() -> FastAPI:
             enabled=False,
         )
 
+    if settings.subject_cache_enabled:
+        logger.info(
+            "Subject cache enabled: ttl=%ds maxsize=%d",
+            settings.subject_cache_ttl,
+            settings.subject_cache_maxsize,
+        )
+    else:
+        logger.info("Subject cache disabled")
+    subject_cache = SubjectCache(
+        maxsize=settings.subject_cache_maxsize,
+        ttl_seconds=settings.subject_cache_ttl,
+        enabled=settings.subject_cache_enabled,
+    )
+
     logger.info(
         "Loaded %d policies from %d packages: %s",
         engine.policy_count,
@@ -64,6 +77,22 @@ def create_app() -> FastAPI:
         engine.get_packages(),
     )
 
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        # Everything started here is stopped on exit, so the app can be
+        # started again after shutdown.
+        log_listener = configure_logging(settings)
+        app.state.policy_executor = ThreadPoolExecutor(
+            max_workers=settings.policy_worker_threads,
+            thread_name_prefix="policy",
+        )
+        try:
+            yield
+        finally:
+            app.state.policy_executor.shutdown(wait=True)
+            if log_listener is not None:
+                shutdown_logging(log_listener)
+
     # Create FastAPI app
     app = FastAPI(
         title="CELINE MQTT Auth Service",
@@ -71,6 +100,7 @@ def create_app() -> FastAPI:
         version="1.0.0",
         docs_url="/docs",
         redoc_url="/redoc",
+        lifespan=lifespan,
     )
 
     # Add CORS middleware
@@ -82,27 +112,29 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
-    # Store settings and engine in app state
+    # Store shared state, read by the route dependencies
     app.state.settings = settings
     app.state.engine = cached_engine
-
-    # Override dependencies to use app state
-    app.dependency_overrides[get_settings] = lambda: app.state.settings
-    app.dependency_overrides[get_engine] = lambda: app.state.engine
+    app.state.subject_cache = subject_cache
 
     # Include MQTT routes
     app.include_router(router)
 
-    # Health check endpoint
-    @app.get("/health")
-    async def health_check():
-        """Health check endpoint."""
-        return {
+    # Health check endpoint. Policies are loaded once at startup, so the
+    # payload is serialized once and served as-is to every probe.
+    health_body = json.dumps(
+        {
             "status": "healthy",
             "policies_loaded": engine.is_loaded,
             "policy_count": engine.policy_count,
             "packages": engine.get_packages(),
         }
+    ).encode()
+
+    @app.get("/health")
+    async def health_check() -> Response:
+        """Health check endpoint."""
+        return Response(content=health_body, media_type="application/json")
 
     # Cache stats endpoint (if caching enabled)
     # if settings.policies_cache_enabled:
@@ -0,0 +1,41 @@
+"""Request ID generation for MQTT auth service."""
+
+import os
+import threading
+import uuid
+
+_ID_BYTES = 16
+_POOL_SIZE = 256
+
+_lock = threading.Lock()
+_pool = b""
+_pos = 0
+
+
+def _reset_pool() -> None:
+    # A forked worker inherits the parent's pool; without a reset it would hand
+    # out the same request IDs as the parent and its siblings.
+    global _lock, _pool, _pos
+    _lock = threading.Lock()
+    _pool = b""
+    _pos = 0
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pool)
+
+
+def new_request_id() -> str:
+    """Return a random (version 4) UUID string.
+
+    Random bytes are read from the OS for 256 IDs at a time, so a request ID
+    costs a slice of a buffer instead of a ``getrandom()`` syscall.
+    """
+    global _pool, _pos
+    with _lock:
+        if _pos >= len(_pool):
+            _pool = os.urandom(_ID_BYTES * _POOL_SIZE)
+            _pos = 0
+        chunk = _pool[_pos : _pos + _ID_BYTES]
+        _pos += _ID_BYTES
+    return str(uuid.UUID(bytes=chunk, version=4))
@@ -1,12 +1,16 @@
 """FastAPI routes for MQTT authentication."""
 
+import asyncio
 import logging
 import time
-import uuid
+from concurrent.futures import Executor
+from functools import partial
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Header, Response, status, Request
+from pydantic import ValidationError
 
+from celine.mqtt_auth.cache import SubjectCache
 from celine.mqtt_auth.config import MqttAuthSettings
 from celine.mqtt_auth.models import (
     MqttAclRequest,
@@ -14,6 +18,7 @@ from celine.mqtt_auth.models import (
     MqttResponse,
     MqttSuperuserRequest,
 )
+from celine.mqtt_auth.request_id import new_request_id
 from celine.sdk.auth import JwtUser
 from celine.sdk.auth.jwt import extract_groups
 from celine.sdk.policies import (
@@ -30,33 +35,65 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["MQTT Auth"])
 
+# Responses with a fixed reason are built once and shared across requests
+_MISSING_TOKEN = MqttResponse(ok=False, reason="missing token")
+_INVALID_CREDENTIALS = MqttResponse(ok=False, reason="invalid credentials")
+_INVALID_ACC = MqttResponse(ok=False, reason="invalid acc mask")
+_CHECK_FAILED = MqttResponse(ok=False, reason="check failed")
+_AUTHENTICATED = MqttResponse(ok=True, reason="authenticated")
+_AUTHORIZED = MqttResponse(ok=True, reason="authorized")
+_SUPERUSER = MqttResponse(ok=True, reason="superuser")
+_NOT_SUPERUSER = MqttResponse(ok=False, reason="not superuser")
 
-def get_settings() -> MqttAuthSettings:
+
+async def get_settings(request: Request) -> MqttAuthSettings:
     """Get settings from app state."""
-    # This will be overridden by dependency injection in main.py
-    return MqttAuthSettings()
+    return request.app.state.settings
 
 
-def get_engine() -> CachedPolicyEngine:
+async def get_engine(request: Request) -> CachedPolicyEngine:
     """Get policy engine from app state."""
-    # This will be overridden by dependency injection in main.py
-    raise NotImplementedError("Engine not configured")
+    return request.app.state.engine
+
+
+async def get_policy_executor(request: Request) -> Executor:
+    """Get policy evaluation executor from app state."""
+    return request.app.state.policy_executor
+
+
+async def get_subject_cache(request: Request) -> SubjectCache:
+    """Get subject cache from app state."""
+    return request.app.state.subject_cache
 
 
 def _get_token_from_header(authorization: str | None) -> str | None:
     """Extract bearer token from Authorization header."""
-    if authorization and authorization.lower().startswith("bearer "):
-        return authorization.split(" ", 1)[1].strip()
+    if authorization and authorization[:7].lower() == "bearer ":
+        return authorization[7:].strip()
     return None
 
 
+def _looks_like_jwt(token: str) -> bool:
+    """Cheap shape check: a compact JWS has exactly three dot-separated parts."""
+    return token.count(".") == 2
+
+
 def _extract_subject_from_token(
-    token: str, settings: MqttAuthSettings
+    token: str, settings: MqttAuthSettings, cache: SubjectCache
 ) -> Subject | None:
     """Extract subject from JWT token.
 
+    Subjects of previously validated tokens are served from the cache.
     Returns None if token is invalid.
     """
+    if not _looks_like_jwt(token):
+        logger.debug("Failed to extract subject from token: not a JWT")
+        return None
+
+    subject = cache.get(token)
+    if subject is not None:
+        return subject
+
     try:
         # Validate JWT if JWKS URI is configured
         user = JwtUser.from_token(token, oidc=settings.oidc)
@@ -76,7 +113,7 @@ def _extract_subject_from_token(
         elif scopes:
             subject_type = SubjectType.SERVICE
 
-        return Subject(
+        subject = Subject(
             id=user.sub,
             type=subject_type,
             groups=groups,
@@ -87,8 +124,24 @@ def _extract_subject_from_token(
         logger.debug("Failed to extract subject from token: %s", e)
         return None
 
+    cache.set(token, subject, user.exp)
+    return subject
+
+
+# Action names for every combination of the three mosquitto access bits
+_ACC_ACTIONS: tuple[tuple[str, ...], ...] = (
+    (),
+    ("read",),
+    ("publish",),
+    ("publish", "read"),
+    ("subscribe",),
+    ("subscribe", "read"),
+    ("subscribe", "publish"),
+    ("subscribe", "publish", "read"),
+)
 
-def _acc_to_actions(acc: int) -> list[str]:
+
+def _acc_to_actions(acc: int) -> tuple[str, ...]:
     """Convert mosquitto acc bitmask to action names.
 
     Bitmask values:
@@ -96,14 +149,7 @@ def _acc_to_actions(acc: int) -> list[str]:
     - 2 = publish
     - 4 = subscribe
     """
-    actions: list[str] = []
-    if acc & 0x04:  # 4
-        actions.append("subscribe")
-    if acc & 0x02:  # 2
-        actions.append("publish")
-    if acc & 0x01:  # 1
-        actions.append("read")
-    return actions or []
+    return _ACC_ACTIONS[acc & 0x07]
 
 
 @router.post("/user")
@@ -111,6 +157,7 @@ async def mqtt_auth(
     response: Response,
     authorization: Annotated[str | None, Header()] = None,
     settings: MqttAuthSettings = Depends(get_settings),
+    subject_cache: SubjectCache = Depends(get_subject_cache),
 ) -> MqttResponse:
     """Authenticate MQTT client via JWT.
 
@@ -126,16 +173,16 @@ async def mqtt_auth(
     if not token:
         logger.debug("MQTT auth failed: missing token")
         response.status_code = status.HTTP_403_FORBIDDEN
-        return MqttResponse(ok=False, reason="missing token")
+        return _MISSING_TOKEN
 
-    subject = _extract_subject_from_token(token, settings)
+    subject = _extract_subject_from_token(token, settings, subject_cache)
     if subject is None:
         logger.debug("MQTT auth failed: invalid credentials")
         response.status_code = status.HTTP_403_FORBIDDEN
-        return MqttResponse(ok=False, reason="invalid credentials")
+        return _INVALID_CREDENTIALS
 
     logger.info("MQTT auth success: user=%s", subject.id)
-    return MqttResponse(ok=True, reason="authenticated")
+    return _AUTHENTICATED
 
 
 @router.post("/acl")
@@ -146,11 +193,14 @@ async def mqtt_acl(
     authorization: Annotated[str | None, Header()] = None,
     x_request_id: Annotated[str | None, Header()] = None,
     engine: CachedPolicyEngine = Depends(get_engine),
+    executor: Executor = Depends(get_policy_executor),
     settings: MqttAuthSettings = Depends(get_settings),
+    subject_cache: SubjectCache = Depends(get_subject_cache),
 ) -> MqttResponse:
     """Authorize MQTT topic access.
 
     mosquitto-go-auth calls this endpoint for each pub/sub operation.
+    Policies are evaluated on the policy executor, off the event loop.
 
     Returns:
     - 200 + ok=true if authorized
@@ -161,65 +211,82 @@ async def mqtt_acl(
     raw_body = await request.body()
     try:
         body = MqttAclRequest.model_validate_json(raw_body)
-    except Exception as e:
-        logger.warning(f"Failed to parse body: {raw_body}")
+    except ValidationError:
+        logger.warning("Failed to parse body: %r", raw_body)
         raise HTTPException(500, "Failed to parse request body")
 
-    request_id = x_request_id or str(uuid.uuid4())
-
     token = _get_token_from_header(authorization)
     if not token:
         logger.debug("MQTT ACL failed: missing token (topic=%s)", body.topic)
         response.status_code = status.HTTP_403_FORBIDDEN
-        return MqttResponse(ok=False, reason="missing token")
+        return _MISSING_TOKEN
 
-    subject = _extract_subject_from_token(token, settings)
+    subject = _extract_subject_from_token(token, settings, subject_cache)
     if subject is None:
         logger.debug("MQTT ACL failed: invalid credentials (topic=%s)", body.topic)
         response.status_code = status.HTTP_403_FORBIDDEN
-        return MqttResponse(ok=False, reason="invalid credentials")
+        return _INVALID_CREDENTIALS
 
     # Convert acc bitmask to action names
     actions = _acc_to_actions(body.acc)
     if not actions:
         response.status_code = status.HTTP_403_FORBIDDEN
-        return MqttResponse(ok=False, reason="invalid acc mask")
-
-    # Check each action (publish, subscribe, read)
-    for action_name in actions:
-        policy_input = PolicyInput(
+        return _INVALID_ACC
+
+    # All actions of one check share the same resource and environment.
+    # Every field comes from already validated values, so the models skip
+    # re-validation.
+    resource = Resource.model_construct(type=ResourceType.TOPIC, id=body.topic)
+    request_id = x_request_id or new_request_id()
+    environment = {"request_id": request_id, "timestamp": time.time()}
+    policy_inputs = [
+        PolicyInput.model_construct(
             subject=subject,
-            resource=Resource(
-                type=ResourceType.TOPIC,
-                id=body.topic,
-                attributes={},
-            ),
-            action=Action(name=action_name, context={}),
-            environment={"request_id": request_id, "timestamp": time.time()},
+            resource=resource,
+            action=Action.model_construct(name=action_name),
+            environment=environment,
         )
+        for action_name in actions
+    ]
 
-        try:
-            decision = engine.evaluate_decision(
-                policy_package=settings.mqtt_policy_package,
-                policy_input=policy_input,
+    # Evaluate all actions (publish, subscribe, read) concurrently on the
+    # policy executor; the first denied action in acc order decides.
+    loop = asyncio.get_running_loop()
+    try:
+        decisions = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    executor,
+                    partial(
+                        engine.evaluate_decision,
+                        policy_package=settings.mqtt_policy_package,
+                        policy_input=policy_input,
+                    ),
+                )
+                for policy_input in policy_inputs
             )
-
-            if not decision.allowed:
-                logger.warning(
-                    "MQTT ACL denied: user=%s topic=%s action=%s reason=%s input=%s",
-                    subject.id,
-                    body.topic,
-                    action_name,
-                    decision.reason,
-                    policy_input.model_dump_json(),
+        )
+    except Exception as e:
+        logger.exception("MQTT ACL check failed: %s", e)
+        response.status_code = status.HTTP_403_FORBIDDEN
+        return _CHECK_FAILED
+
+    for action_name, policy_input, decision in zip(actions, policy_inputs, decisions):
+        if not decision.allowed:
+            logger.warning(
+                "MQTT ACL denied: user=%s topic=%s action=%s reason=%s",
+                subject.id,
+                body.topic,
+                action_name,
+                decision.reason,
+            )
+            # Serializing the full input is costly, only do it when asked
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "MQTT ACL denied input: %s", policy_input.model_dump_json()
                 )
-                response.status_code = status.HTTP_403_FORBIDDEN
-                return MqttResponse(ok=False, reason=decision.reason)
-
-        except Exception as e:
-            logger.exception("MQTT ACL check failed: %s", e)
             response.status_code = status.HTTP_403_FORBIDDEN
-            return MqttResponse(ok=False, reason=f"check failed")
+            return MqttResponse(ok=False, reason=decision.reason)
 
     logger.info(
         "MQTT ACL allowed: user=%s topic=%s actions=%s",
@@ -227,7 +294,7 @@ async def mqtt_acl(
         body.topic,
         actions,
     )
-    return MqttResponse(ok=True, reason="authorized")
+    return _AUTHORIZED
 
 
 @router.post("/superuser")
@@ -236,6 +303,7 @@ async def mqtt_superuser(
     response: Response,
     authorization: Annotated[str | None, Header()] = None,
     settings: MqttAuthSettings = Depends(get_settings),
+    subject_cache: SubjectCache = Depends(get_subject_cache),
 ) -> MqttResponse:
     """Check if client is MQTT superuser.
 
@@ -249,13 +317,13 @@ async def mqtt_superuser(
     if not token:
         logger.debug("MQTT superuser check failed: missing token")
         response.status_code = status.HTTP_403_FORBIDDEN
-        return MqttResponse(ok=False, reason="missing token")
+        return _MISSING_TOKEN
 
-    subject = _extract_subject_from_token(token, settings)
+    subject = _extract_subject_from_token(token, settings, subject_cache)
     if subject is None:
         logger.debug("MQTT superuser check failed: invalid credentials")
         response.status_code = status.HTTP_403_FORBIDDEN
-        return MqttResponse(ok=False, reason="invalid credentials")
+        return _INVALID_CREDENTIALS
 
     # Check for superuser scope
     if (
@@ -264,8 +332,8 @@ async def mqtt_superuser(
         or "mqtt.admin" in subject.groups
     ):
         logger.info("MQTT superuser: user=%s", subject.id)
-        return MqttResponse(ok=True, reason="superuser")
+        return _SUPERUSER
 
     logger.debug("MQTT superuser check failed: user=%s", subject.id)
     response.status_code = status.HTTP_403_FORBIDDEN
-    return MqttResponse(ok=False, reason="not superuser")
+    return _NOT_SUPERUSER
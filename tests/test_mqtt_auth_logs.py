@@ -0,0 +1,200 @@
+import io
+import logging
+import queue
+import sys
+import threading
+
+from celine.mqtt_auth.config import MqttAuthSettings
+from celine.mqtt_auth.logs import (
+    BatchingQueueListener,
+    BufferedStreamHandler,
+    DroppingQueueHandler,
+    configure_logging,
+    shutdown_logging,
+)
+
+
+def _record(msg: str) -> logging.LogRecord:
+    return logging.LogRecord("test", logging.INFO, __file__, 1, msg, None, None)
+
+
+def test_dropping_queue_handler_evicts_oldest_records():
+    log_queue: queue.Queue = queue.Queue(maxsize=1)
+    handler = DroppingQueueHandler(log_queue)
+
+    handler.handle(_record("first"))
+    handler.handle(_record("second"))
+
+    assert log_queue.qsize() == 1
+    assert log_queue.get_nowait().getMessage() == "second"
+    assert handler.dropped == 1
+
+
+def test_dropping_queue_handler_reports_drops_once():
+    log_queue: queue.Queue = queue.Queue(maxsize=2)
+    handler = DroppingQueueHandler(log_queue)
+
+    for msg in ("one", "two", "three", "four"):
+        handler.handle(_record(msg))
+    assert handler.dropped == 2
+
+    # Drain the queue, the next record is preceded by a single summary
+    log_queue.get_nowait()
+    log_queue.get_nowait()
+    handler.handle(_record("five"))
+
+    summary = log_queue.get_nowait()
+    assert summary.levelno == logging.WARNING
+    assert summary.getMessage() == "Dropped 2 log records: log queue full"
+    assert log_queue.get_nowait().getMessage() == "five"
+    assert handler.dropped == 2
+
+    handler.handle(_record("six"))
+    assert log_queue.get_nowait().getMessage() == "six"
+
+
+def test_dropping_queue_handler_defers_formatting():
+    log_queue: queue.Queue = queue.Queue()
+    handler = DroppingQueueHandler(log_queue)
+    record = logging.LogRecord(
+        "test", logging.INFO, __file__, 1, "user=%s", ("u1",), None
+    )
+
+    handler.handle(record)
+
+    queued = log_queue.get_nowait()
+    assert queued.args == ("u1",)
+    assert queued.getMessage() == "user=u1"
+
+
+def test_buffered_stream_handler_writes_in_batches():
+    stream = io.StringIO()
+    handler = BufferedStreamHandler(stream, batch_size=2)
+
+    handler.handle(_record("one"))
+    assert stream.getvalue() == ""
+
+    handler.handle(_record("two"))
+    assert stream.getvalue() == "one\ntwo\n"
+
+    handler.handle(_record("three"))
+    handler.flush()
+    assert stream.getvalue() == "one\ntwo\nthree\n"
+
+
+class FlakyStream(io.StringIO):
+    """Stream whose first ``failures`` writes raise, like a stalled pipe."""
+
+    def __init__(self, failures: int = 1):
+        super().__init__()
+        self.failures = failures
+
+    def write(self, s: str) -> int:
+        if self.failures:
+            self.failures -= 1
+            raise OSError("Resource temporarily unavailable")
+        return super().write(s)
+
+
+def test_buffered_stream_handler_reports_write_errors(monkeypatch):
+    monkeypatch.setattr(logging, "raiseExceptions", False)
+    handler = BufferedStreamHandler(FlakyStream(), batch_size=1)
+    errors = []
+    monkeypatch.setattr(handler, "handleError", errors.append)
+
+    handler.handle(_record("lost"))
+    handler.handle(_record("kept"))
+
+    assert [r.getMessage() for r in errors] == ["lost"]
+    assert handler.stream.getvalue() == "kept\n"
+
+
+def test_listener_survives_stream_write_errors(monkeypatch):
+    monkeypatch.setattr(logging, "raiseExceptions", False)
+    stream = FlakyStream()
+    writer = BufferedStreamHandler(stream, batch_size=1)
+    log_queue: queue.Queue = queue.Queue()
+    listener = BatchingQueueListener(log_queue, writer)
+
+    listener.start()
+    log_queue.put(_record("lost"))
+    log_queue.put(_record("kept"))
+    listener.stop()
+
+    assert stream.getvalue() == "kept\n"
+
+
+def test_configure_logging_takes_over_console_output(monkeypatch):
+    root = logging.getLogger()
+    console = logging.StreamHandler(sys.stderr)
+    other = logging.NullHandler()
+    monkeypatch.setattr(root, "handlers", [console, other])
+    monkeypatch.setattr(root, "level", root.level)
+
+    listener = configure_logging(MqttAuthSettings(log_level="DEBUG"))
+    try:
+        assert listener is not None
+        assert root.handlers[0] is other
+        assert isinstance(root.handlers[1], DroppingQueueHandler)
+        assert isinstance(listener.handlers[0], BufferedStreamHandler)
+        assert root.level == logging.DEBUG
+        assert configure_logging(MqttAuthSettings()) is None
+    finally:
+        shutdown_logging(listener)
+
+    # The displaced console handler is not re-attached on shutdown
+    assert root.handlers == [other]
+
+
+def test_listener_flushes_records_on_shutdown(monkeypatch):
+    root = logging.getLogger()
+    monkeypatch.setattr(root, "handlers", [])
+    monkeypatch.setattr(root, "level", root.level)
+
+    listener = configure_logging(MqttAuthSettings(log_batch_size=1000))
+    stream = io.StringIO()
+    listener.handlers[0].setStream(stream)
+
+    logging.getLogger("celine.test").info("queued %s", "record")
+    shutdown_logging(listener)
+
+    assert "queued record" in stream.getvalue()
+
+
+class BlockingHandler(logging.Handler):
+    """Handler that stalls until released, like a writer stuck on I/O."""
+
+    def __init__(self):
+        super().__init__()
+        self.entered = threading.Event()
+        self.unblocked = threading.Event()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.entered.set()
+        self.unblocked.wait()
+        self.records.append(record)
+
+
+def test_shutdown_with_full_queue(monkeypatch):
+    root = logging.getLogger()
+    monkeypatch.setattr(root, "handlers", [])
+    monkeypatch.setattr(root, "level", root.level)
+
+    listener = configure_logging(MqttAuthSettings(log_queue_maxsize=5))
+    blocking = BlockingHandler()
+    listener.handlers = (blocking,)
+
+    log = logging.getLogger("celine.test")
+    log.info("stuck")
+    assert blocking.entered.wait(1)
+    for i in range(20):
+        log.info("record %d", i)
+    assert listener.queue.full()
+
+    # Unblock the writer only once shutdown has had to face a full queue
+    threading.Timer(0.1, blocking.unblocked.set).start()
+    shutdown_logging(listener)
+
+    assert not any(isinstance(h, DroppingQueueHandler) for h in root.handlers)
+    assert blocking.records[-1].getMessage() == "record 19"
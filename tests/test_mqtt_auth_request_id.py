@@ -0,0 +1,37 @@
+import os
+import uuid
+
+import pytest
+
+from celine.mqtt_auth.request_id import new_request_id
+
+
+def test_new_request_id_is_uuid4():
+    parsed = uuid.UUID(new_request_id())
+
+    assert parsed.version == 4
+
+
+def test_new_request_id_unique_across_pool_refills():
+    ids = {new_request_id() for _ in range(1000)}
+
+    assert len(ids) == 1000
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_new_request_id_not_shared_with_forked_child():
+    new_request_id()  # make sure the parent holds a partly used pool
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        os.write(write_fd, new_request_id().encode())
+        os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd) as pipe:
+        child_id = pipe.read()
+    os.waitpid(pid, 0)
+
+    assert child_id
+    assert child_id != new_request_id()
@@ -0,0 +1,246 @@
+"""Tests for the MQTT auth service endpoints."""
+
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from celine.mqtt_auth import routes
+from celine.mqtt_auth.main import create_app
+
+POLICIES_DIR = Path(__file__).resolve().parents[1] / "policies"
+
+SERVICE_CLAIMS = {
+    "sub": "svc-pipelines",
+    "scope": "pipelines.runs.read pipelines.runs.write",
+    "client_id": "svc-pipelines",
+}
+
+READER_CLAIMS = {
+    "sub": "svc-reader",
+    "scope": "pipelines.runs.read",
+    "client_id": "svc-reader",
+}
+
+
+class FakeJwtUser:
+    """Stands in for celine.sdk JwtUser: maps tokens to claims."""
+
+    tokens: dict[str, dict] = {}
+    calls = 0
+
+    @classmethod
+    def from_token(cls, token, oidc):
+        cls.calls += 1
+        claims = cls.tokens.get(token)
+        if claims is None:
+            raise ValueError("invalid token")
+        return SimpleNamespace(
+            sub=claims["sub"], claims=claims, exp=claims.get("exp")
+        )
+
+
+@pytest.fixture(scope="module")
+def app_client():
+    """One app (and one policy load) shared by every test in the module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("CELINE_POLICIES_DIR", str(POLICIES_DIR))
+        mp.setattr(routes, "JwtUser", FakeJwtUser)
+        with TestClient(create_app()) as client:
+            yield client
+
+
+@pytest.fixture
+def jwt_user(monkeypatch):
+    monkeypatch.setattr(
+        FakeJwtUser,
+        "tokens",
+        {"svc.jwt.token": SERVICE_CLAIMS, "reader.jwt.token": READER_CLAIMS},
+    )
+    monkeypatch.setattr(FakeJwtUser, "calls", 0)
+    return FakeJwtUser
+
+
+@pytest.fixture
+def client(app_client, jwt_user):
+    app_client.app.state.subject_cache.clear()
+    return app_client
+
+
+def _auth(token: str = "svc.jwt.token") -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.mark.parametrize(
+    "header,expected",
+    [
+        ("Bearer abc.def.ghi", "abc.def.ghi"),
+        ("bearer abc.def.ghi", "abc.def.ghi"),
+        ("BEARER  abc.def.ghi ", "abc.def.ghi"),
+        ("Basic dXNlcjpwYXNz", None),
+        ("Bearer", None),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_get_token_from_header(header, expected):
+    assert routes._get_token_from_header(header) == expected
+
+
+def test_health(client):
+    response = client.get("/health")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    body = response.json()
+    assert body["status"] == "healthy"
+    assert body["policies_loaded"] is True
+    assert body["policy_count"] > 0
+    assert "celine.mqtt.acl" in body["packages"]
+
+
+class TestUserEndpoint:
+    def test_valid_token(self, client):
+        response = client.post("/user", headers=_auth())
+
+        assert response.status_code == 200
+        assert response.json() == {"ok": True, "reason": "authenticated"}
+
+    def test_missing_token(self, client):
+        response = client.post("/user")
+
+        assert response.status_code == 403
+        assert response.json()["reason"] == "missing token"
+
+    def test_invalid_token(self, client):
+        response = client.post("/user", headers=_auth("bad.jwt.token"))
+
+        assert response.status_code == 403
+        assert response.json()["reason"] == "invalid credentials"
+
+    def test_non_jwt_token_skips_validation(self, client, jwt_user):
+        response = client.post("/user", headers=_auth("not-a-jwt"))
+
+        assert response.status_code == 403
+        assert response.json()["reason"] == "invalid credentials"
+        assert jwt_user.calls == 0
+
+
+class TestAclEndpoint:
+    @pytest.mark.parametrize(
+        "token,topic,acc,expected_status",
+        [
+            ("svc.jwt.token", "celine/pipelines/runs/r1", 2, 200),
+            ("svc.jwt.token", "celine/pipelines/runs/r1", 7, 200),
+            ("svc.jwt.token", "celine/dt/values/v1", 1, 403),
+            ("reader.jwt.token", "celine/pipelines/runs/r1", 1, 200),
+            # Denied as soon as any requested action is denied
+            ("reader.jwt.token", "celine/pipelines/runs/r1", 3, 403),
+        ],
+    )
+    def test_policy_decision(self, client, token, topic, acc, expected_status):
+        response = client.post(
+            "/acl",
+            headers=_auth(token),
+            json={"clientid": "c1", "topic": topic, "acc": acc},
+        )
+
+        assert response.status_code == expected_status
+        assert response.json()["ok"] is (expected_status == 200)
+        if expected_status == 200:
+            assert response.json()["reason"] == "authorized"
+
+    def test_engine_error_fails_closed(self, client, monkeypatch):
+        def boom(**kwargs):
+            raise RuntimeError("engine down")
+
+        monkeypatch.setattr(client.app.state.engine, "evaluate_decision", boom)
+
+        response = client.post(
+            "/acl",
+            headers=_auth(),
+            json={"clientid": "c1", "topic": "celine/pipelines/runs/r1", "acc": 7},
+        )
+
+        assert response.status_code == 403
+        assert response.json()["reason"] == "check failed"
+
+    def test_invalid_acc_mask(self, client):
+        response = client.post(
+            "/acl",
+            headers=_auth(),
+            json={"clientid": "c1", "topic": "celine/pipelines/runs/r1", "acc": 0},
+        )
+
+        assert response.status_code == 403
+        assert response.json()["reason"] == "invalid acc mask"
+
+    def test_malformed_body(self, client):
+        response = client.post("/acl", headers=_auth(), content=b"{not json")
+
+        assert response.status_code == 500
+
+    def test_missing_token(self, client):
+        response = client.post(
+            "/acl", json={"clientid": "c1", "topic": "celine/dt/test", "acc": 1}
+        )
+
+        assert response.status_code == 403
+        assert response.json()["reason"] == "missing token"
+
+
+def test_app_restarts_after_shutdown(monkeypatch, jwt_user):
+    monkeypatch.setenv("CELINE_POLICIES_DIR", str(POLICIES_DIR))
+    monkeypatch.setattr(routes, "JwtUser", FakeJwtUser)
+    app = create_app()
+    body = {"clientid": "c1", "topic": "celine/pipelines/runs/r1", "acc": 2}
+
+    for _ in range(2):
+        with TestClient(app) as client:
+            response = client.post("/acl", headers=_auth(), json=body)
+            assert response.status_code == 200
+
+
+class TestSuperuserEndpoint:
+    def test_admin_scope(self, client, jwt_user):
+        jwt_user.tokens["admin.jwt.token"] = {
+            "sub": "svc-admin",
+            "scope": "mqtt.admin",
+            "client_id": "svc-admin",
+        }
+
+        response = client.post(
+            "/superuser", headers=_auth("admin.jwt.token"), json={"username": "a"}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["reason"] == "superuser"
+
+    def test_not_superuser(self, client):
+        response = client.post("/superuser", headers=_auth(), json={"username": "a"})
+
+        assert response.status_code == 403
+        assert response.json()["reason"] == "not superuser"
+
+
+class TestSubjectCaching:
+    def test_token_validated_once(self, client, jwt_user):
+        for _ in range(3):
+            assert client.post("/user", headers=_auth()).status_code == 200
+
+        assert jwt_user.calls == 1
+
+    def test_invalid_token_not_cached(self, client, jwt_user):
+        for _ in range(2):
+            assert client.post("/user", headers=_auth("bad.jwt.token")).status_code == 403
+
+        assert jwt_user.calls == 2
+
+    def test_expired_token_not_cached(self, client, jwt_user):
+        jwt_user.tokens["old.jwt.token"] = {**SERVICE_CLAIMS, "exp": time.time() - 1}
+
+        for _ in range(2):
+            client.post("/user", headers=_auth("old.jwt.token"))
+
+        assert jwt_user.calls == 2
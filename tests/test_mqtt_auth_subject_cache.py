@@ -0,0 +1,64 @@
+import time
+
+from celine.sdk.policies import Subject, SubjectType
+
+from celine.mqtt_auth.cache import SubjectCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _subject() -> Subject:
+    return Subject(id="svc-pipelines", type=SubjectType.SERVICE, scopes=["a.b.read"])
+
+
+def test_subject_cache_hit_and_miss():
+    cache = SubjectCache(maxsize=10, ttl_seconds=60)
+    subject = _subject()
+
+    assert cache.get("token") is None
+    cache.set("token", subject, expires_at=None)
+
+    assert cache.get("token") is subject
+    assert cache.get("other") is None
+
+
+def test_subject_cache_ttl_expires():
+    clock = FakeClock()
+    cache = SubjectCache(maxsize=10, ttl_seconds=60, timer=clock)
+    cache.set("token", _subject(), expires_at=None)
+
+    clock.now = 59.0
+    assert cache.get("token") is not None
+    clock.now = 61.0
+    assert cache.get("token") is None
+
+
+def test_subject_cache_ttl_capped_by_token_exp():
+    clock = FakeClock()
+    cache = SubjectCache(maxsize=10, ttl_seconds=60, timer=clock)
+    cache.set("token", _subject(), expires_at=time.time() + 10)
+
+    clock.now = 9.0
+    assert cache.get("token") is not None
+    clock.now = 11.0
+    assert cache.get("token") is None
+
+
+def test_subject_cache_skips_expired_tokens():
+    cache = SubjectCache(maxsize=10, ttl_seconds=60)
+    cache.set("token", _subject(), expires_at=time.time() - 1)
+
+    assert len(cache) == 0
+
+
+def test_subject_cache_disabled():
+    cache = SubjectCache(maxsize=10, ttl_seconds=60, enabled=False)
+    cache.set("token", _subject(), expires_at=None)
+
+    assert cache.get("token") is None
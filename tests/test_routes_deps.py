@@ -16,21 +16,18 @@ class FakeValidator(JWTValidator):
         return self._claims or {}
 
 
-@pytest.mark.asyncio
-async def test_get_subject_returns_none_without_header(monkeypatch):
+async def test_get_subject_returns_none_without_header():
     subj = await deps.get_subject(authorization=None, jwt_validator=FakeValidator())
     assert subj is None
 
 
-@pytest.mark.asyncio
-async def test_get_subject_rejects_bad_header(monkeypatch):
+async def test_get_subject_rejects_bad_header():
     with pytest.raises(HTTPException) as e:
         await deps.get_subject(authorization="Bad xxx", jwt_validator=FakeValidator())
     assert e.value.status_code == 401
 
 
-@pytest.mark.asyncio
-async def test_get_subject_valid(monkeypatch):
+async def test_get_subject_valid():
     claims = {"sub": "u1", "iat": 1, "exp": 2, "iss": "x", "groups": ["g"]}
     subj = await deps.get_subject(
         authorization="Bearer token", jwt_validator=FakeValidator(claims=claims)